@@ -24,6 +24,9 @@ from .rectangle import rinput
 
 from .clickfig import ClickFig
 
-from importlib_metadata import version
+try:
+    from importlib.metadata import version
+except ImportError:  # Python < 3.8, use backport (slower to import)
+    from importlib_metadata import version
 
 __version__ = version('drapo')
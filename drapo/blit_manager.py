@@ -0,0 +1,124 @@
+"""Blitting management shared by all interactive objects of a canvas."""
+
+import weakref
+
+
+_blit_managers = weakref.WeakKeyDictionary()  # canvas: BlitManager
+
+
+def get_blit_manager(canvas):
+    """Return the blit manager of the canvas, created if necessary."""
+    try:
+        return _blit_managers[canvas]
+    except KeyError:
+        manager = _blit_managers[canvas] = BlitManager(canvas)
+        return manager
+
+
+class BlitManager:
+    """Save background and blit animated artists on one axes of a canvas.
+
+    Adapted from the BlitManager of matplotlib's blitting tutorial: the
+    background is copied at every full draw of the canvas (draw_event), where
+    animated artists are not drawn. Here, only the background of the axes
+    where motion happens (self.ax) is saved, not that of the whole figure.
+    """
+
+    def __init__(self, canvas):
+        # weak reference, because canvas is the key of _blit_managers
+        self._canvas = weakref.ref(canvas)
+        self._ax = None  # weak reference to axes whose background is saved
+        self.background = None  # pixel background of ax (without animated artists)
+        self.background_key = None  # what background contains (see state_key)
+        self.stale = True  # if True, background needs to be captured again
+        self._supported = None  # see supported
+        self.cid = canvas.mpl_connect('draw_event', self.on_draw)
+
+    @property
+    def canvas(self):
+        return self._canvas()
+
+    @property
+    def ax(self):
+        return self._ax() if self._ax is not None else None
+
+    @ax.setter
+    def ax(self, ax):
+        # weak reference, because ax refers to the canvas (_blit_managers key)
+        self._ax = weakref.ref(ax) if ax is not None else None
+
+    @property
+    def supported(self):
+        """True if the canvas supports blitting (probed only once)."""
+        if self._supported is None:
+            canvas = self.canvas
+            supported = getattr(canvas, 'supports_blit', False)
+            if supported:
+                try:
+                    canvas.copy_from_bbox(canvas.figure.bbox)
+                except Exception:  # e.g. no renderer, broken backend
+                    supported = False
+            self._supported = supported
+        return self._supported
+
+    def on_draw(self, event):
+        """Capture background of ax after a full draw of the canvas."""
+        canvas = self.canvas
+        if event.canvas is not canvas or canvas.is_saving():
+            return  # savefig (other dpi, or other canvas e.g. for pdf/svg)
+        if self.ax is not None:
+            self.background = event.canvas.copy_from_bbox(self.ax.bbox)
+            self.background_key = self.state_key(self.ax)
+            self.stale = False
+
+    @staticmethod
+    def state_key(ax):
+        """Cheap description of the non-animated contents of ax.
+
+        If the key is the same as when the background was saved, e.g. when
+        the same artists are dragged again, the background is still valid.
+        Artists modified since the last draw are stale, which changes the key
+        (note: axes titles are stale even right after drawing).
+        """
+        key = [ax.bbox.bounds, ax.viewLim.bounds]
+        for artist in ax.get_children():
+            if not artist.get_animated():
+                key.append((id(artist), artist.get_visible(), artist.zorder,
+                            artist.stale))
+        return tuple(key)
+
+    def set_animated(self, artists, animated):
+        """Set animated state of artists; background is stale if changed."""
+        for artist in artists:
+            if artist.get_animated() != animated:
+                artist.set_animated(animated)
+                self.stale = True
+
+    def add_artists(self, artists):
+        """Animate artists, which thus have to be removed from background."""
+        self.set_animated(artists, True)
+
+    def remove_artists(self, artists):
+        """Stop animating artists, which thus have to be added to background."""
+        self.set_animated(artists, False)
+
+    def update(self, ax, artists):
+        """Draw artists on the background of ax, and blit.
+
+        Background is captured again (with a full draw) only if needed.
+        """
+        canvas = self.canvas
+        if ax is not self.ax:
+            self.ax = ax
+            canvas.draw()  # background saved in on_draw
+        elif self.stale:
+            key = self.state_key(ax)
+            if key == self.background_key:
+                self.stale = False  # e.g. same artists animated as before
+            else:
+                canvas.draw()
+        canvas.restore_region(self.background)
+        draw_artist = ax.draw_artist
+        for artist in artists:
+            draw_artist(artist)
+        canvas.blit(ax.bbox)
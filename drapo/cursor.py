@@ -12,7 +12,12 @@ and allowing zooming/panning.
 # TODO -- add option to pick exact already drawn datapoints close to the click
 
 
-import time
+import weakref
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib import rcParams
+from matplotlib.lines import Line2D
 
 from .interactive_object import InteractiveObject
 
@@ -57,6 +62,9 @@ class Cursor(InteractiveObject):
     - `mark_symbol` (matplolib's symbol, default: '+')
     - `mark_size` (matplotlib's markersize, default: 10)
 
+    - `raise_window` (bool, default True). Bring figure window to the front
+    (only once per figure if not blocking, see bring_to_front()).
+
     Useful class methods
     --------------------
     - `erase_marks()`: erase click marks on the plot.
@@ -69,20 +77,30 @@ class Cursor(InteractiveObject):
     - `visible`: bool, sets whether cursor drawn or not when in axes.
     - `inaxes`: book, true when mouse (and thus cursor) is in axes
     - `clicknumber`: track the number of recorded clicks.
-    - `clickdata`: stores the (x, y) data of clicks in a list.
-    - `marks`: list of matplotlib artists containing all click marks drawn.
+    - `clickdata`: (x, y) data of clicks as a (clicknumber, 2) array (view).
+    - `marks`: dict of matplotlib collections (one per axes) of click marks.
     """
 
     name = 'Cursor'
 
+    # only one cursor per figure (fig: weak reference to cursor). Weak keys
+    # and values, because cursors and figures refer to each other.
+    active_cursors = weakref.WeakKeyDictionary()
+
+    commands_color = ('shift+right', 'shift+left')  # keys to change color
+    commands_width = ('shift+up', 'shift+down')  # keys to change width
+    command_keys = frozenset((' ', 'a', 'z', 'enter',
+                              *commands_color, *commands_width))
+
     def __init__(self, fig=None, color=None, c=None, linestyle=':', linewidth=1,
                  blit=True, show_clicks=False, record_clicks=False,
                  mouse_add=1, mouse_pop=3, mouse_stop=2,
                  n=1000, block=False, timeout=0,
-                 mark_symbol='+', mark_size=10):
+                 mark_symbol='+', mark_size=10, raise_window=True):
         """Note: cursor drawn only when the mouse enters axes."""
 
-        super().__init__(fig, color=color, c=c, blit=blit, block=block)
+        super().__init__(fig, color=color, c=c, blit=blit, block=block,
+                         raise_window=raise_window)
 
         # Cursor state attributes
         self.press = False  # active when mouse is currently pressed
@@ -90,6 +108,7 @@ class Cursor(InteractiveObject):
         self.inaxes = False  # True when mouse is in axes
 
         # Appearance options
+        self._color_index = self.__class__.colors.index(self.color)  # for cycling
         self.style = linestyle
         self.width = linewidth
         self.marksymbol = mark_symbol
@@ -103,17 +122,72 @@ class Cursor(InteractiveObject):
         self.stopbutton = mouse_stop
 
         # Recording click data
-        self.clicknumber = 0  # tracks the number of clicks
         self.n = n  # maximum number of clicks, after which cursor is deactivated
-        self.clickdata = []  # stores the (x, y) data of clicks in a list
-        self.marks = []  # list containing all artists drawn
-
-        self.fig.canvas.draw()
+        self._clickbuf = np.empty((16, 2))  # stores the (x, y) data of clicks
+        self._nclicks = 0  # number of rows of _clickbuf actually used
+        self.delete_on_stop = True  # see stop()
+        self.marks = {}  # axes: collection containing all marks drawn in axes
+        self.kept_marks = 0  # number of first marks not removable by remove_point()
+        self._mark_xy = {}  # axes: (k, 2) array of mark positions (data coords)
+        self._mark_colors = {}  # axes: list of k mark colors
+        self._mark_axes = []  # axes of every mark, in the order of clicks
+
+        # Data of horizontal and vertical lines (row 0: x, row 1: y). The
+        # x-extent of the horizontal line and y-extent of the vertical line
+        # are kept in sync with the axes limits by on_x/ylim_change.
+        self._h_xy = np.empty((2, 2))
+        self._v_xy = np.empty((2, 2))
+        self.limits_ax = None  # axes whose limits changes are being tracked
+
+        # Coalescing of motion events: at most one redraw is in flight, and
+        # motion events received in the meantime only update _pending_event.
+        self._draw_scheduled = False
+        self._pending_event = None
+        self._replay_timer = None  # replays _pending_event after a draw
+        self._last_xy_px = None  # pixel position of last cursor drawing
+
+        # axes: (bbox bounds, background) for blitting, valid until next draw
+        self._bg_cache = {}
+
+        # actions triggered by key presses (see on_key_press). Handlers
+        # return True if they have already updated the display themselves.
+        # I use 'z' here because backspace (as used in ginput) interferes
+        # with the interactive "back" option in matplotlib
+        self.key_handlers = {
+            ' ': self.toggle_visibility,
+            'a': lambda event: self.add_point((event.xdata, event.ydata)),
+            'z': lambda event: self.remove_point(),
+        }
+        for key in self.commands_color:
+            self.key_handlers[key] = self.change_color
+        for key in self.commands_width:
+            self.key_handlers[key] = self.change_width
+
+        # delete any other existing cursor on the figure
+        other = self.__class__.active_cursor(self.fig)
+        if other is not None:
+            other.delete()
+        self.__class__.active_cursors[self.fig] = weakref.ref(self)
+
+        self.fig.canvas.draw_idle()
 
         # the blocking option below needs to be after connect()
         if self.block:
             self.fig.canvas.start_event_loop(timeout=timeout)
 
+    @property
+    def clicknumber(self):
+        """Number of recorded clicks."""
+        return self._nclicks
+
+    @property
+    def clickdata(self):
+        """(x, y) data of recorded clicks, as a (clicknumber, 2) array.
+
+        This is a view on the data buffer: copy it to keep it unchanged.
+        """
+        return self._clickbuf[:self._nclicks]
+
     def __repr__(self):
 
         name = self.__class__.name
@@ -145,30 +219,48 @@ class Cursor(InteractiveObject):
     def create(self, event):
         """Draw a cursor (h+v lines) that stop at the edge of the axes."""
         ax = self.ax
-        xmin, xmax = ax.get_xlim()
-        ymin, ymax = ax.get_ylim()
 
-        self.delete_others('fig')  # delete all other existing cursors on the figure
+        if self.all_artists:
+            if self.all_artists[0].axes is ax:
+                # cursor already drawn in these axes: just move it
+                self.update_position(event)
+                return
+            # cursor left in other axes (e.g. if mouse was pressed on leave)
+            self.eraser('erase', draw=False)
 
-        x, y = event.xdata, event.ydata
-        # horizontal and vertical cursor lines, the animated option is for blitting
-        hline, = ax.plot([xmin, xmax], [y, y], color=self.color,
-                         linewidth=self.width, linestyle=self.style,
-                         animated=self.__class__.blit)
-        vline, = ax.plot([x, x], [ymin, ymax], color=self.color,
-                         linewidth=self.width, linestyle=self.style,
-                         animated=self.__class__.blit)
+        # cache line extents so that they are not re-queried at every motion
+        self._h_xy[0] = ax.get_xlim()
+        self._v_xy[1] = ax.get_ylim()
 
-        # because plotting the lines can change the initial xlim, ylim
-        ax.set_xlim(xmin, xmax)
-        ax.set_ylim(ymin, ymax)
+        self._h_xy[1] = event.ydata
+        self._v_xy[0] = event.xdata
+
+        # horizontal and vertical cursor lines, the animated option is for blitting
+        hline = Line2D(*self._h_xy, color=self.color,
+                       linewidth=self.width, linestyle=self.style,
+                       animated=self.blitting)
+        vline = Line2D(*self._v_xy, color=self.color,
+                       linewidth=self.width, linestyle=self.style,
+                       animated=self.blitting)
+
+        # contrary to plot(), add_artist() does not update data limits nor
+        # trigger autoscaling, so that xlim, ylim do not need to be restored
+        ax.add_artist(hline)
+        ax.add_artist(vline)
 
         self.all_artists = hline, vline
+        self.connect_limits(ax)
+
+        # new cursor lines, nothing in flight or drawn for them
+        self._draw_scheduled = False
+        self._pending_event = None
+        self._last_xy_px = None
+
         # Note: addition to all_objects is made automatically by InteractiveObject parent class
-        self.__class__.moving_objects.add(self)
+        self.add_to_moving_objects()
 
         # Below is for cursor to be visible upon creation
-        if self.__class__.blit:
+        if self.blitting:
             self.fig.canvas.blit(self.ax.bbox)
         else:
             self.fig.canvas.draw()
@@ -176,19 +268,117 @@ class Cursor(InteractiveObject):
     def update_position(self, event):
         """Update position of the cursor to follow mouse event."""
 
-        x = event.xdata  # For cursors it is sufficient to work with data coordinates
-        y = event.ydata  # (no need to go to pixels as the cursor is always in axes)
+        h_xy = self._h_xy
+        v_xy = self._v_xy
+
+        # For cursors it is sufficient to work with data coordinates
+        # (no need to go to pixels as the cursor is always in axes)
+        h_xy[1] = event.ydata
+        v_xy[0] = event.xdata
 
         hline, vline = self.all_artists
 
-        # accommodates changes in axes limits while cursor is on
-        xmin, xmax = self.ax.get_xlim()
-        ymin, ymax = self.ax.get_ylim()
+        # extents (h_xy[0], v_xy[1]) are updated by on_xlim/ylim_change
+        hline.set_data(h_xy[0], h_xy[1])
+        vline.set_data(v_xy[0], v_xy[1])
+
+    def get_background(self, ax):
+        """Background of ax for blitting, copied from canvas only if needed."""
+        bounds = ax.bbox.bounds
+        try:
+            cached_bounds, background = self._bg_cache[ax]
+        except KeyError:
+            pass
+        else:
+            if cached_bounds == bounds:
+                return background
+        background = self.fig.canvas.copy_from_bbox(ax.bbox)
+        self._bg_cache[ax] = bounds, background
+        return background
+
+    def apply_style(self):
+        """Apply current color and width to the existing cursor lines."""
+        for artist in self.all_artists:
+            artist.set_color(self.color)
+            artist.set_linewidth(self.width)
+
+    def can_blit(self):
+        """True if blitting is on and the saved background is up to date."""
+        manager = self.blit_manager
+        return (self.blitting and manager.ax is self.ax
+                and manager.background is not None and not manager.stale)
+
+    def erase_cursor(self):
+        """Erase cursor lines, without full redraw if blitting is possible."""
+        if self.can_blit():
+            # animated cursor lines are not part of the background, so
+            # restoring it is enough to erase them (no full redraw)
+            self.eraser('erase', draw=False)
+            self.fig.canvas.restore_region(self.blit_manager.background)
+            self.fig.canvas.blit(self.ax.bbox)
+        else:
+            self.erase()
 
-        hline.set_xdata([xmin, xmax])
-        hline.set_ydata([y, y])
-        vline.set_xdata([x, x])
-        vline.set_ydata([ymin, ymax])
+    def blit_marks(self):
+        """Blit last mark of current axes, and include it in the background."""
+        canvas = self.fig.canvas
+        ax = self.ax
+        canvas.restore_region(self.blit_manager.background)
+        # previous marks are already in the background: draw only the last
+        # one, because drawing marks again over themselves darkens them
+        marks = self.marks[ax]
+        marks.set_offsets(self._mark_xy[ax][-1:])
+        marks.set_color(self._mark_colors[ax][-1:])
+        ax.draw_artist(marks)
+        self.update_marks(ax)
+        # marks are static: save them in the background before drawing cursor
+        background = canvas.copy_from_bbox(ax.bbox)
+        self.blit_manager.background = background
+        self.blit_manager.background_key = None
+        self._bg_cache[ax] = ax.bbox.bounds, background
+        for artist in self.all_artists:
+            ax.draw_artist(artist)
+        canvas.blit(ax.bbox)
+
+    def blit_cursor(self):
+        """Redraw only the cursor lines on the saved background (blitting)."""
+        canvas = self.fig.canvas
+        canvas.restore_region(self.blit_manager.background)
+        for artist in self.all_artists:
+            self.ax.draw_artist(artist)
+        canvas.blit(self.ax.bbox)
+
+    def connect_limits(self, ax):
+        """Track changes in axes limits to adapt the extent of cursor lines."""
+        if ax is self.limits_ax:
+            return
+        self.disconnect_limits()
+        self.cidxlim = ax.callbacks.connect('xlim_changed', self.on_xlim_change)
+        self.cidylim = ax.callbacks.connect('ylim_changed', self.on_ylim_change)
+        self.limits_ax = ax
+
+    def disconnect_limits(self):
+        """Stop tracking changes in axes limits."""
+        if self.limits_ax is None:
+            return
+        self.limits_ax.callbacks.disconnect(self.cidxlim)
+        self.limits_ax.callbacks.disconnect(self.cidylim)
+        self.limits_ax = None
+
+    def delete(self):
+        """Hard delete of cursor, including tracking of axes limits."""
+        self.disconnect_limits()
+        if self._replay_timer is not None:
+            self._replay_timer.stop()
+        if self.__class__.active_cursor(self.fig) is self:
+            del self.__class__.active_cursors[self.fig]
+        super().delete()
+
+    @classmethod
+    def active_cursor(cls, fig):
+        """Return the cursor currently active on fig, None if no cursor."""
+        cursor_ref = cls.active_cursors.get(fig)
+        return cursor_ref() if cursor_ref is not None else None
 
     def set_press_info(self, event):
         self.press_info = {'currently_pressed': True,
@@ -196,44 +386,134 @@ class Cursor(InteractiveObject):
 
     def erase_marks(self):
         """Erase plotted clicks (marks) without removing click data"""
-        for mark in self.marks:
-            mark.remove()
-        self.fig.canvas.draw()
+        for marks in self.marks.values():
+            marks.remove()
+        self.marks = {}
+        self._mark_xy = {}
+        self._mark_colors = {}
+        self._mark_axes = []
+        self.fig.canvas.draw_idle()
+        if self.block:
+            # make sure marks are cleared before returning (e.g. in ginput)
+            self.fig.canvas.flush_events()
 
     def erase_data(self):
         """Erase data of recorded clicks"""
-        self.clickdata = []
+        self._clickbuf = np.empty((16, 2))
+        self._nclicks = 0
+
+    def add_mark(self, x, y):
+        """Add click mark at (x, y) in the marks collection of current axes."""
+        ax = self.ax
+        if ax not in self.marks:
+            # single collection for all marks of the axes, updated in place
+            xlim, ylim = ax.get_xlim(), ax.get_ylim()
+            # (color given, so that the axes color cycle is not advanced)
+            self.marks[ax] = ax.scatter([], [], marker=self.marksymbol,
+                                        s=self.marksize**2, color=self.color,
+                                        linewidths=rcParams['lines.markeredgewidth'])
+            # to prevent autoscaling (e.g. reset of zoom) due to scatter()
+            ax.set_xlim(xlim, auto=None)
+            ax.set_ylim(ylim, auto=None)
+            self._mark_xy[ax] = np.empty((0, 2))
+            self._mark_colors[ax] = []
+        self._mark_xy[ax] = np.append(self._mark_xy[ax], [(x, y)], axis=0)
+        self._mark_colors[ax].append(self.color)
+        self._mark_axes.append(ax)
+        self.update_marks(ax)
+
+    def remove_mark(self):
+        """Remove most recent click mark, whatever axes it is in."""
+        ax = self._mark_axes.pop(-1)
+        self._mark_xy[ax] = self._mark_xy[ax][:-1]
+        self._mark_colors[ax].pop(-1)
+        self.update_marks(ax)
+
+    def update_marks(self, ax):
+        """Apply stored positions and colors to the marks collection of ax."""
+        marks = self.marks[ax]
+        marks.set_offsets(self._mark_xy[ax])
+        marks.set_color(self._mark_colors[ax])
 
     def add_point(self, pos):
-        """Add point to the click data (triggered by click or key press)"""
+        """Add point to the click data (triggered by click or key press)
+
+        Return True if the display is up to date (mark drawn by blitting).
+        """
         x, y = pos
         if self.recordclicks:
-            self.clickdata.append((x, y))
-            self.clicknumber += 1
+            if self._nclicks == len(self._clickbuf):  # buffer full
+                self._clickbuf = np.concatenate((self._clickbuf,
+                                                 np.empty_like(self._clickbuf)))
+            self._clickbuf[self._nclicks] = x, y
+            self._nclicks += 1
 
         if self.markclicks:
-            mark, = self.ax.plot(x, y, marker=self.marksymbol, color=self.color,
-                                 markersize=self.marksize)
-            self.marks.append(mark)
+            self.add_mark(x, y)
+            if self.all_artists and self.can_blit():
+                self.blit_marks()
+                return True
         self.fig.canvas.draw()
+        return False
+
+    def stop(self):
+        """Stop cursor (max number of clicks reached, or stop button/key).
+
+        The cursor is deleted, except if delete_on_stop is False, in which
+        case only the blocking event loop is stopped (used by ginput).
+        """
+        if self.delete_on_stop:
+            print('Cursor disconnected (max number of clicks, or stop button pressed).')
+            self.delete()
+        else:
+            self.fig.canvas.stop_event_loop()
 
     def remove_point(self):
         """Add point to the click data (triggered by click or key press)"""
-        if self.recordclicks:
-            if self.clicknumber == 0:
-                pass
-            else:
-                self.clicknumber -= 1
-                self.clickdata.pop(-1)  # remove last element
+        if self.recordclicks and self._nclicks:
+            self._nclicks -= 1  # remove last element
 
         if self.markclicks:
-            if len(self.marks) == 0:
-                pass
+            if len(self._mark_axes) <= self.kept_marks:
+                pass  # e.g. marks made before ginput
             else:
-                mark = self.marks.pop(-1)
-                mark.remove()
+                self.remove_mark()
         self.fig.canvas.draw()
 
+    def toggle_visibility(self, event):
+        """Toggle visibility status, and create/erase cursor if in axes."""
+        if self.inaxes:  # create or delete cursor only if it's in axes
+            self.erase() if self.visible else self.create(event)
+        self.visible = not self.visible  # always change visibility status
+
+    def change_width(self, event):
+        """Increase or decrease cursor linewidth depending on key pressed."""
+        if event.key == self.commands_width[0]:
+            self.width += 0.5
+        else:
+            self.width = self.width - 0.5 if self.width > 0.5 else 0.5
+        return self.restyle()
+
+    def change_color(self, event):
+        """Cycle through class colors, direction depending on key pressed."""
+        colors = self.__class__.colors
+        if colors[self._color_index] != self.color:  # color set by user
+            self._color_index = colors.index(self.color)
+        step = -1 if event.key == self.commands_color[1] else 1
+        self._color_index = (self._color_index + step) % len(colors)
+        self.color = colors[self._color_index]
+        return self.restyle()
+
+    def restyle(self):
+        """Apply new style to cursor. Return True if display is up to date."""
+        if not self.all_artists:
+            return False
+        self.apply_style()  # in place, no need to re-create the artists
+        if self.can_blit():
+            self.blit_cursor()
+            return True
+        return False
+
 # ============================= callback methods =============================
 
     def on_enter_axes(self, event):
@@ -242,43 +522,110 @@ class Cursor(InteractiveObject):
         self.ax = event.inaxes
         if self.visible:
             self.create(event)
-        if self.__class__.blit:
-            self.__class__.background = self.fig.canvas.copy_from_bbox(self.ax.bbox)
+        if self.blitting:
+            manager = self.blit_manager
+            manager.ax = self.ax
+            manager.background = self.get_background(self.ax)
+            manager.background_key = None
+
+    def on_xlim_change(self, ax):
+        """Accommodate changes in x limits while cursor is on."""
+        self._h_xy[0] = ax.get_xlim()
+        self._bg_cache.pop(ax, None)
+        self._last_xy_px = None  # same pixel is now at different data coords
+        if self.all_artists:
+            hline, _ = self.all_artists
+            hline.set_xdata(self._h_xy[0])
+
+    def on_ylim_change(self, ax):
+        """Accommodate changes in y limits while cursor is on."""
+        self._v_xy[1] = ax.get_ylim()
+        self._bg_cache.pop(ax, None)
+        self._last_xy_px = None  # same pixel is now at different data coords
+        if self.all_artists:
+            _, vline = self.all_artists
+            vline.set_ydata(self._v_xy[1])
+
+    def on_resize(self, event):
+        """Also discard saved backgrounds, which have the wrong size."""
+        super().on_resize(event)
+        self._bg_cache.clear()
 
     def on_leave_axes(self, event):
         """Erase cursor when mouse leaves axes."""
         self.inaxes = False
         if self.visible and not self.press_info['currently_pressed']:
-            self.erase()
+            self.erase_cursor()
 
     def on_motion(self, event):
         """Update position of the cursor when mouse is in motion."""
         # do nothing if pressed to avoid weird interactions with panning
         if self.visible and self.inaxes and not self.press_info['currently_pressed']:
+            if self._draw_scheduled:
+                # previous redraw not finished: only keep the latest position
+                # (even if on the last drawn pixel, to not replay an older one)
+                self._pending_event = event
+                return
+            xy_px = int(event.x), int(event.y)
+            if xy_px == self._last_xy_px:
+                return  # cursor already drawn at this pixel
+            self._draw_scheduled = True
+            self._last_xy_px = xy_px
             self.update_graph(event)
+            if self.blitting:
+                # blitting is synchronous and does not emit any draw_event
+                self.acknowledge_draw()
+
+    def on_draw(self, event):
+        """Figure has been redrawn: saved backgrounds are not valid anymore."""
+        super().on_draw(event)
+        self._bg_cache.clear()
+        if self._pending_event is None:
+            self._draw_scheduled = False
+        else:
+            # Replaying the motion now would request a redraw from within the
+            # current draw, which GUI backends (e.g. Qt, Tk) ignore, so that
+            # the cursor would freeze: replay once the draw is finished.
+            self.replay_timer().start()
+
+    def replay_timer(self):
+        """Single-shot timer calling acknowledge_draw from the event loop."""
+        if self._replay_timer is None:
+            timer = self.fig.canvas.new_timer(interval=0)
+            timer.single_shot = True
+            timer.add_callback(self.acknowledge_draw)
+            self._replay_timer = timer
+        return self._replay_timer
+
+    def acknowledge_draw(self):
+        """Acknowledge redraw and replay the most recent pending motion."""
+        self._draw_scheduled = False
+        pending_event = self._pending_event
+        if pending_event is not None:
+            self._pending_event = None
+            self.on_motion(pending_event)
 
     def on_mouse_press(self, event):
         """If mouse is pressed, deactivate cursor temporarily."""
+        if not self.press_info['currently_pressed']:
+            # no motion callbacks at all during panning/zooming
+            self.event_dispatcher.disconnect(self.cidmotion)
         self.set_press_info(event)
         if self.visible and self.inaxes:
-            self.erase()
+            self.erase_cursor()
 
     def on_mouse_release(self, event):
         """When releasing click, reactivate cursor and redraw figure.
 
         This is in order to accommodate potential zooming/panning.
         """
+        if self.press_info['currently_pressed']:
+            self.cidmotion = self.event_dispatcher.connect('motion_notify_event',
+                                                           self.on_motion)
         self.press_info['currently_pressed'] = False
         if self.visible and self.inaxes:
             self.create(event)
 
-        # I don't understand why I need to do the hack below to not have a
-        # strange re-appearance of the background before zooming (panning is ok)
-        # when the mouse go into motion again (not rightaway). Even more
-        # surprising is that if I shortcut on_motion by calling update_graph
-        # directly here, it does not work.
-        self.__class__.initiating_motion = True  # to reactivate cursor
-
         # See if click needs to be recorded.
 
         x, y = (event.xdata, event.ydata)
@@ -291,9 +638,17 @@ class Cursor(InteractiveObject):
             elif event.button == self.removebutton:
                 self.remove_point()
 
-        if self.clicknumber == self.n or event.button == self.stopbutton:
-            print('Cursor disconnected (max number of clicks, or stop button pressed).')
-            self.delete()
+        else:
+            # I don't understand why I need to do the hack below to not have a
+            # strange re-appearance of the background before zooming (panning is ok)
+            # when the mouse go into motion again (not rightaway). Even more
+            # surprising is that if I shortcut on_motion by calling update_graph
+            # directly here, it does not work.
+            # (only after panning/zooming, so that plain clicks can be blitted)
+            self.blit_manager.stale = True  # to reactivate cursor
+
+        if self.clicknumber >= self.n or event.button == self.stopbutton:
+            self.stop()
 
     def on_key_press(self, event):
         """Key press controls. Space bar toggles cursor visibility.
@@ -306,59 +661,26 @@ class Cursor(InteractiveObject):
             - "z" : cancel last point
             - enter : stop recording
         """
-# ----------------- changes in appearance of cursor --------------------------
-
-        commands_color = ['shift+right', 'shift+left']  # keys to change color
-        commands_width = ['shift+up', 'shift+down']
-
-        if event.key == " ":  # Space Bar
-            if self.inaxes:  # create or delete cursor only if it's in axes
-                self.erase() if self.visible else self.create(event)
-            self.visible = not self.visible  # always change visibility status
-
-        if event.key == commands_width[0]:
-            self.width += 0.5
-
-        if event.key == commands_width[1]:
-            self.width = self.width - 0.5 if self.width > 0.5 else 0.5
-
-        if event.key in commands_color:
-            # finds at which position the current color is in the list
-            colorindex = self.__class__.colors.index(self.color)
-            if event.key == commands_color[1]:
-                colorindex -= 1
-            else:
-                colorindex += 1
-            colorindex = colorindex % len(self.__class__.colors)
-            self.color = self.__class__.colors[colorindex]
-
-        if event.key in commands_color + commands_width:
-            self.erase()  # easy way to not have to update artist
-            self.create(event)
-
-# ------------------- recording or removing click data -----------------------
-
-        x, y = (event.xdata, event.ydata)
+        if event.key not in self.command_keys:
+            return  # e.g. typing, or keys managed by matplotlib/backend
 
-        if event.key == 'a':
-            self.add_point((x, y))
+# ---------------- appearance of cursor, recording click data ----------------
 
-        # I use 'z' here because backspace (as used in ginput) interferes
-        # with the interactive "back" option in matplotlib
-        elif event.key == 'z':
-            self.remove_point()
+        handler = self.key_handlers.get(event.key)
+        # (no handler, i.e. nothing new to display, for the 'enter' key)
+        updated = handler(event) if handler is not None else True
 
 # --------------------implement changes on graph -----------------------------
 
-        # hack to see changes directly and to prevent display bugs
-        self.__class__.initiating_motion = True
-        self.update_graph(event)
+        if not updated:  # display not already updated by the handler
+            # hack to see changes directly and to prevent display bugs
+            self.blit_manager.stale = True
+            self.update_graph(event)
 
 # ------------------------ stop if necessary ---------------------------------
 
-        if self.clicknumber == self.n or event.key == 'enter':
-            print('Cursor disconnected (max number of clicks, or stop button pressed).')
-            self.delete()
+        if self.clicknumber >= self.n or event.key == 'enter':
+            self.stop()
 
     def on_pick(self, event):
         """Contrary to draggble objects, no self-picking here."""
@@ -387,15 +709,70 @@ def ginput(n=1, timeout=0, show_clicks=True,
     https://matplotlib.org/3.2.0/api/_as_gen/matplotlib.pyplot.ginput.html
     with only an additional one: blit (bool, default True): see Cursor.
 
+    If a cursor is already active on the current figure, it is used for the
+    graphical input (with its current blit setting), and its settings are
+    restored afterwards; otherwise, a new cursor is created and deleted at
+    the end.
+
     Returns
     -------
     List of tuples corresponding to the list of clicked (x, y) coordinates.
 
     """
-    c = Cursor(block=True, record_clicks=True, show_clicks=show_clicks, n=n,
-               mouse_add=mouse_add, mouse_stop=mouse_stop, mouse_pop=mouse_pop,
-               blit=blit)
-    data = c.clickdata
-    time.sleep(0.2)  # just to have time to see the last click and its mark
-    c.erase_marks()
+    c = Cursor.active_cursor(plt.gcf())
+
+    if c is None:
+        c = Cursor(block=True, record_clicks=True, show_clicks=show_clicks, n=n,
+                   mouse_add=mouse_add, mouse_stop=mouse_stop, mouse_pop=mouse_pop,
+                   blit=blit)
+        data = [tuple(xy) for xy in c.clickdata.tolist()]
+        _wait_for_redraw(c.fig.canvas)
+        c.erase_marks()
+        return data
+
+    # A cursor is already active on the figure: reconfigure it temporarily
+    # rather than replacing it by a new one (blit setting is kept as is).
+    settings = {attr: getattr(c, attr) for attr in _GINPUT_SETTINGS}
+    nmarks = len(c._mark_axes)
+
+    c.n = n
+    c.recordclicks = True
+    c.markclicks = show_clicks
+    c.clickbutton = mouse_add
+    c.removebutton = mouse_pop
+    c.stopbutton = mouse_stop
+    c.erase_data()  # new buffer, the previous one is kept in settings
+    c.kept_marks = nmarks  # right clicks only remove marks made by ginput
+    c.block = True
+    c.delete_on_stop = False
+
+    c.fig.canvas.start_event_loop(timeout=timeout)
+    data = [tuple(xy) for xy in c.clickdata.tolist()]
+    _wait_for_redraw(c.fig.canvas)
+
+    # remove only the marks added by ginput, and restore cursor settings
+    while len(c._mark_axes) > nmarks:
+        c.remove_mark()
+    c.fig.canvas.draw_idle()
+    for attr, value in settings.items():
+        setattr(c, attr, value)
+
     return data
+
+
+# Cursor attributes modified by ginput when reusing an existing cursor
+_GINPUT_SETTINGS = ('n', 'recordclicks', 'markclicks', 'clickbutton',
+                    'removebutton', 'stopbutton', '_clickbuf', '_nclicks',
+                    'block', 'delete_on_stop', 'kept_marks')
+
+
+def _wait_for_redraw(canvas, timeout=0.05):
+    """Wait (at most timeout, in s) until the canvas is actually redrawn.
+
+    Used e.g. to have time to see the last click and its mark.
+    """
+    ciddraw = canvas.mpl_connect('draw_event',
+                                 lambda event: canvas.stop_event_loop())
+    canvas.draw_idle()
+    canvas.start_event_loop(timeout=timeout)
+    canvas.mpl_disconnect(ciddraw)
@@ -0,0 +1,74 @@
+"""Dispatching of canvas events to all interactive objects of a canvas."""
+
+import functools
+import itertools
+import weakref
+
+
+# canvas: weak reference to EventDispatcher (the dispatcher is kept alive by
+# the figure's callback registry, see EventDispatcher)
+_event_dispatchers = weakref.WeakKeyDictionary()
+
+
+def get_event_dispatcher(canvas):
+    """Return the event dispatcher of the canvas, created if necessary."""
+    dispatcher_ref = _event_dispatchers.get(canvas)
+    dispatcher = dispatcher_ref() if dispatcher_ref is not None else None
+    if dispatcher is None:
+        dispatcher = EventDispatcher(canvas)
+        _event_dispatchers[canvas] = weakref.ref(dispatcher)
+    return dispatcher
+
+
+class EventDispatcher:
+    """Connect a single callback per event name to the canvas.
+
+    This callback calls in turn the methods of all interactive objects
+    registered for this event, in order of connection. Contrary to
+    matplotlib's CallbackRegistry, these methods are referenced strongly:
+    connected objects thus live as long as the figure (which owns the
+    callback registry), even if the user does not keep any reference.
+    """
+
+    def __init__(self, canvas):
+        # weak reference, because canvas is the key of _event_dispatchers
+        self._canvas = weakref.ref(canvas)
+        self.callbacks = {}  # event name: {cid: method}
+        self.names = {}  # cid: event name
+        self.canvas_cids = {}  # event name: cid of dispatch() in canvas
+        self._cids = itertools.count()
+
+    @property
+    def canvas(self):
+        return self._canvas()
+
+    def connect(self, name, method):
+        """Call bound method when event name occurs; return connection id."""
+        callbacks = self.callbacks.get(name)
+        if callbacks is None:
+            callbacks = self.callbacks[name] = {}
+            dispatch = functools.partial(self.dispatch, name)
+            self.canvas_cids[name] = self.canvas.mpl_connect(name, dispatch)
+        cid = next(self._cids)
+        callbacks[cid] = method
+        self.names[cid] = name
+        return cid
+
+    def disconnect(self, cid):
+        """Disconnect method registered with connection id cid."""
+        name = self.names.pop(cid, None)
+        if name is None:  # already disconnected
+            return
+        callbacks = self.callbacks[name]
+        del callbacks[cid]
+        if not callbacks:  # no object listening anymore, stop dispatching
+            del self.callbacks[name]
+            canvas = self.canvas
+            if canvas is not None:
+                canvas.mpl_disconnect(self.canvas_cids.pop(name))
+
+    def dispatch(self, name, event):
+        """Call all methods registered for event name."""
+        # copy, because callbacks can (dis)connect objects
+        for method in list(self.callbacks.get(name, {}).values()):
+            method(event)
@@ -3,15 +3,28 @@
 Line, Rect and Cursor each subclass the InteractiveObject class defined here.
 """
 
+import contextlib
+import functools
+import weakref
+
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.colors import is_color_like
 
+from .blit_manager import get_blit_manager
+from .event_dispatcher import get_event_dispatcher
+
 
 def main():
     obj = InteractiveObject()  # For testing purposes
     return obj
 
 
+@functools.lru_cache(maxsize=256)
+def _is_color_like_cached(color):
+    return is_color_like(color)
+
+
 class InteractiveObject:
     """Base class for moving objects on a figure. Used for subclassing only.
 
@@ -20,11 +33,20 @@ class InteractiveObject:
 
     name = 'Interactive Object'
 
-    all_interactive_objects = []  # tracking all instances of all subclasses
-    # (use the all_instances() method to get instances of a single class)
-    # This list is returned by the classmethod all_objects().
+    # Registries below only keep weak references to objects and figures, so
+    # that they do not prevent garbage collection of closed figures. Objects
+    # are kept alive by the event dispatcher of their figure while connected.
 
-    moving_objects = set()  # objects currently moving on figure. Includes
+    all_interactive_objects = weakref.WeakValueDictionary()  # tracking all
+    # instances of all subclasses as id(obj): obj, in order of creation (use
+    # the class_objects() method to get instances of a single class). The
+    # list of these objects is returned by the classmethod all_objects().
+
+    figure_objects = weakref.WeakKeyDictionary()  # fig: {class: list of weak
+    # references to instances of the class on fig, in order of creation},
+    # for fast numbering of objects in __repr__.
+
+    moving_objects = weakref.WeakSet()  # objects currently moving on figure. Includes
     # all subclasses, to be able to manage motion of objects of different
     # classes on the same figure.
 
@@ -32,28 +54,42 @@ class InteractiveObject:
     # objects when several objects are selected/moving at the same time.
     # This feature is required due to blitting rendering issues.
 
-    initiating_motion = False  # True when the leading object had been selected
-
-    # Attributes for fast rendering of motion with blitting.
+    # Fast rendering of motion with blitting (background management is done
+    # by a BlitManager shared by all objects of the same canvas).
     blit = True
-    background = None
+
+    render_pending = weakref.WeakSet()  # figures with a (non-blitting) redraw queued
+    # and not done yet; motion events received in the meantime only update
+    # artists data, which are displayed when the queued redraw happens.
 
     # Define default colors of the class (potentially cycled through by some
     # methods. If user specifies a color not in the list, it is added to the
     # class colors.
     colors = ['crimson', 'dimgray', 'whitesmoke', 'dodgerblue', 'lightgreen']
+    color_set = set(colors)  # same contents, for fast membership tests
+
+    raised_figures = weakref.WeakSet()  # figures already brought to front
+
+    deferred_draws = weakref.WeakSet()  # figures whose redraw after erasing
+    # objects is postponed until the end of a batch_updates() block.
 
     def __init__(self, fig=None, ax=None, color=None, c=None,
-                 blit=True, block=False):
+                 blit=True, block=False, raise_window=True):
 
         self.fig = plt.gcf() if fig is None else fig
         self.ax = plt.gca() if ax is None else ax
+        self.blit_manager = get_blit_manager(self.fig.canvas)
+        self.event_dispatcher = get_event_dispatcher(self.fig.canvas)
 
         # Connect matplotlib event handling to callback functions
         self.connect()
 
         # Tracks instances of any interactive objects of any subclass.
-        self.all_interactive_objects.append(self)
+        self.all_interactive_objects[id(self)] = self
+        classes_on_fig = self.figure_objects.setdefault(self.fig, {})
+        objects_on_fig = classes_on_fig.setdefault(type(self), [])
+        objects_on_fig.append(weakref.ref(self))
+        self.fig_index = len(objects_on_fig)  # number of object on figure
 
         self.all_artists = []  # all artists the object is made of
         self.all_pts = []  # all individual tracking points the object is made of
@@ -64,6 +100,9 @@ class InteractiveObject:
         # is picked, but the two edge points need to be moving/active as well.
 
         self.moving = False  # faster way to check moving objects than to measure the length of moving_objects
+        self._last_xy_px = None  # pixel position of last motion update
+        self._update_position = None  # bound update_position, during motion
+        self.moving_artists = []  # all artists of moving objects, if moving
         self.press_info = {'currently_pressed': False}  # stores useful useful mouse click information
 
         # the last object to be instanciated dictates if blitting is true or not
@@ -81,33 +120,27 @@ class InteractiveObject:
 
         if color is None:
             self.color = self.__class__.colors[0]
-        elif not is_color_like(color):
+        elif not self.is_color(color):
             print('Warning: color not recognized. Falling back to default.')
             self.color = self.__class__.colors[0]
         else:
             self.color = color
-            if color not in self.__class__.colors:
-                self.__class__.colors.append(color)
+            self.add_color(color)
 
         # --------------------------------------------------------------------
 
-        # Transforms functions to go from px to data coords.
-        # Need to be redefined if figure is resized
-        self.datatopx = self.ax.transData.transform  # transform between data coords to px coords.
-        self.pxtodata = self.ax.transData.inverted().transform  # pixels to data coordinates
+        # Transforms functions to go from px to data coords (self.datatopx
+        # and self.pxtodata), redefined only if figure is resized or if
+        # axes limits change (see connect())
+        self._refresh_transforms()
 
-        # this seems to be a generic way to bring window to the front but I
-        # have not checked with all backends etc, and it does not always work
-        plt.get_current_fig_manager().show()
+        if raise_window:
+            self.bring_to_front()
 
     def __repr__(self):
-        object_list = self.__class__.class_objects()
-        objects_on_fig = [obj for obj in object_list if obj.fig == self.fig]
+        objects_on_fig = self.figure_objects.get(self.fig, {}).get(type(self), [])
         n_on_fig = len(objects_on_fig)
-        try:
-            n = objects_on_fig.index(self) + 1
-        except ValueError:  # means object has been deleted
-            n = 'deleted'
+        n = self.fig_index if self.fig_index is not None else 'deleted'
         name = self.__class__.name
         return f'{name} #{n}/{n_on_fig} in Fig. {self.fig.number}.'
 
@@ -121,59 +154,51 @@ class InteractiveObject:
     def update_graph(self, event):
         """Update graph with the moving artists. Called only by the leader."""
 
-        canvas = self.fig.canvas
-        ax = self.ax
+        cls = self.__class__
 
-        if self.__class__.blit and self.__class__.initiating_motion:
-            canvas.draw()
-            self.__class__.background = canvas.copy_from_bbox(ax.bbox)
-            self.__class__.initiating_motion = False
-
-        if self.__class__.blit:
-            # without this line, the graph keeps all successive positions of
-            # the cursor on the screen
-            canvas.restore_region(self.__class__.background)
+        # local snapshot of moving objects, used in the loops below
+        movers = tuple(cls.moving_objects)
 
         # now the leader triggers update of all moving artists including itself
-        for obj in self.__class__.moving_objects:
-
+        for obj in movers:
             # update position data of object depending on its motion mode
-            obj.update_position(event)
-
-            # Draw all artists of the object (if not, some can miss in motion)
-            if self.__class__.blit:
-                for artist in obj.all_artists:
-                    ax.draw_artist(artist)
-
-        # without this below, the graph is not updated
-        if self.__class__.blit:
-            canvas.blit(ax.bbox)
-        else:
-            canvas.draw()
+            # (bound method cached in initiate_motion, not by Cursor)
+            (obj._update_position or obj.update_position)(event)
+
+        if self.blitting:
+            # Draw all artists of all objects (if not, some can miss in motion)
+            # on the saved background, and blit
+            self.blit_manager.update(self.ax, self.moving_artists)
+        elif self.fig not in cls.render_pending:
+            # only one redraw queued at a time (flag reset in on_draw)
+            cls.render_pending.add(self.fig)
+            self.fig.canvas.draw_idle()
 
     def initiate_motion(self, event):
         """Initiate motion and define leading artist that synchronizes plot.
 
-        In particular, if there are several moving objects, save background
-        (for blitting) only once. The line selected first becomes the leader
+        In particular, if there are several moving objects, the background
+        (for blitting) is saved only once. The line selected first becomes the leader
         for moving events, i.e. it is the one that detects mouse moving and
         triggers re-drawing of all other moving lines.
         Note : all moving lines are necesary on the same axes"""
 
         if self.__class__.leader is None:
             self.__class__.leader = self
-            # Below is to delay background setting for blitting until all
-            # artists have been defined as animated.
-            # This is because the canvas.draw() and/or canvas_copy_from_bbox()
-            # calls need to be made with all moving artists declared as animated
-            self.__class__.initiating_motion = True
-            self.fig.canvas.draw()
 
-        self.__class__.moving_objects.add(self)
+        # transforms also change when axes move without any change of limits
+        # or figure size (e.g. tight_layout, colorbar), so refresh them here
+        self._refresh_transforms()
+
+        self.add_to_moving_objects()
         self.moving = True
-        if self.__class__.blit:
-            for artist in self.all_artists:
-                artist.set_animated(True)
+        self._last_xy_px = None
+        # bound method cached for update_graph (not re-created at each event)
+        self._update_position = self.update_position
+        if self.blitting:
+            # background is saved at the first update_graph() call, once all
+            # moving artists have been declared as animated
+            self.blit_manager.add_artists(self.all_artists)
 
         # find which elements need to be active/updated during mouse motion
         # and motion mode (defined in subclasses)
@@ -182,67 +207,100 @@ class InteractiveObject:
         # (defines self.press_info and self.moving_positions)
         self.set_press_info(event)
 
-        # Transforms functions to go from px to data coords.
-        # Need to be redefined if figure is resized or if zooming occurs
-        self.datatopx = self.ax.transData.transform  # transform between data coords to px coords.
-        self.pxtodata = self.ax.transData.inverted().transform  # pixels to data coordinates
-
     def reset_after_motion(self):
         """Reset attributes that should be active only during motion."""
 
         self.picked_artists = set()
         self.active_info = {}
         self.press_info = {'currently_pressed': False}
-        self.moving_positions = {}
         self.moving = False
+        self._update_position = None  # avoids keeping a reference cycle
 
-        if self.__class__.blit:
-            for artist in self.all_artists:
-                artist.set_animated(False)
+        if self.blitting:
+            self.blit_manager.remove_artists(self.all_artists)
 
         # Reset class variables that store moving information
-        self.__class__.moving_objects.remove(self)
+        self.remove_from_moving_objects()
         if self is self.__class__.leader:
             self.__class__.leader = None
 
     def set_press_info(self, event):
-        """Records information related to the mouse click, in px coordinates."""
+        """Records information related to the mouse click, in px coordinates.
 
-        press_info = {'click': (event.x, event.y)}  # record click position
-        moving_positions = {}
+        Positions of pts are stored as (npts, 2) arrays of px coordinates,
+        where pt is in row self.pt_index[pt].
+        """
+        self.press_info = {'click': (event.x, event.y)}  # record click position
+
+        if not self.all_pts:
+            return
 
-        for pt in self.all_pts:
-            xpt, ypt = self.get_pt_position(pt, 'px')
-            press_info[pt] = xpt, ypt  # position of all object pts during click
-            moving_positions[pt] = xpt, ypt  # will be updated during motion
+        # all pts converted to px coords in a single transform call, written
+        # in the arrays allocated when all_pts was set
+        pts_data = [self.get_pt_position(pt, 'data') for pt in self.all_pts]
+        self.press_positions[:] = self.datatopx(pts_data)  # pts during click
+        self.moving_positions[:] = self.press_positions  # updated during motion
 
-        self.press_info = press_info
-        self.moving_positions = moving_positions
+    def eraser(self, option, draw=True):
+        """Private erasing function that is used by erase() and delete()
 
-    def eraser(self, option):
-        """Private erasing function that is used by erase() and delete()"""
+        If draw is False, the figure is not redrawn (e.g. when blitting
+        manages the display of the erased artists).
+        """
 
         for artist in self.all_artists:
             artist.remove()
         self.all_artists = []
 
-        self.fig.canvas.draw()
+        if draw and self.fig not in self.__class__.deferred_draws:
+            self.fig.canvas.draw_idle()
 
         # Check if object is listed as still moving, and remove it.
-        moving_objects = self.__class__.moving_objects
-        if self in moving_objects:
-            moving_objects.remove(self)
+        if self in self.__class__.moving_objects:
+            self.remove_from_moving_objects()
 
         if option == 'erase':
             pass
         elif option == 'delete':
-            self.__class__.all_interactive_objects.remove(self)
+            del self.__class__.all_interactive_objects[id(self)]
+            self.remove_from_figure_objects()
             self.disconnect()
             if self.block:
                 self.fig.canvas.stop_event_loop()
         else:
             print('Warning: eraser function not called properly.')
 
+    def add_to_moving_objects(self):
+        """Add object to moving_objects, and its artists to moving_artists."""
+        self.__class__.moving_objects.add(self)
+        self._update_moving_artists()
+
+    def remove_from_moving_objects(self):
+        """Remove object from moving_objects and its artists from moving_artists."""
+        self.__class__.moving_objects.remove(self)
+        self._update_moving_artists()
+        self.moving_artists = []
+
+    def _update_moving_artists(self):
+        # flattened list shared by all moving objects (not stored in a class
+        # attribute to not prevent garbage collection of figures)
+        moving_objects = self.__class__.moving_objects
+        artists = [artist for obj in moving_objects for artist in obj.all_artists]
+        for obj in moving_objects:
+            obj.moving_artists = artists
+
+    def remove_from_figure_objects(self):
+        """Remove object from figure_objects and renumber the following ones."""
+        classes_on_fig = self.figure_objects[self.fig]
+        objects_on_fig = classes_on_fig[type(self)]
+        i = self.fig_index - 1
+        del objects_on_fig[i]
+        for n, obj_ref in enumerate(objects_on_fig[i:], start=i + 1):
+            obj_ref().fig_index = n
+        if not objects_on_fig:
+            del classes_on_fig[type(self)]
+        self.fig_index = None
+
     def erase(self):
         """Lighter than delete(), keeps object connected and referenced"""
         self.eraser('erase')
@@ -274,22 +332,87 @@ class InteractiveObject:
                              "Possible values: 'all', 'fig', 'ax'.")
 
         others = set(instances) - {self}
-        for other in others:
-            other.delete()
+        with self.batch_updates(*{other.fig for other in others}):
+            for other in others:
+                other.delete()
+
+    @property
+    def all_pts(self):
+        """All individual tracking points the object is made of (tuple)."""
+        return self._all_pts
+
+    @all_pts.setter
+    def all_pts(self, pts):
+        # row of each pt in the position arrays, and arrays themselves, only
+        # change when pts change (e.g. in create()), not at every click
+        self._all_pts = tuple(pts)
+        self.pt_index = {pt: i for i, pt in enumerate(self._all_pts)}
+        self.press_positions = np.empty((len(self._all_pts), 2))
+        self.moving_positions = np.empty((len(self._all_pts), 2))
+
+    @property
+    def blitting(self):
+        """True if blitting is on and supported by the canvas (else draw_idle)."""
+        return self.__class__.blit and self.blit_manager.supported
+
+    def bring_to_front(self):
+        """Show figure window and bring it to the front, if needed.
+
+        Not done (to avoid repeated window activations and redraws) if the
+        figure has already been raised by another object, or if matplotlib is
+        not in interactive mode, except for blocking objects.
+        """
+        cls = self.__class__
+        manager = self.fig.canvas.manager
+        if manager is None:  # e.g. figure not created with pyplot
+            return
+        if not self.block:
+            if self.fig in cls.raised_figures or not plt.isinteractive():
+                return
+        # this seems to be a generic way to bring window to the front but I
+        # have not checked with all backends etc, and it does not always work
+        manager.show()
+        cls.raised_figures.add(self.fig)
+
+    @staticmethod
+    def is_color(color):
+        """Same as matplotlib's is_color_like, cached for hashable colors."""
+        try:
+            return _is_color_like_cached(color)
+        except TypeError:  # unhashable, e.g. list of RGB values
+            return is_color_like(color)
+
+    @classmethod
+    def add_color(cls, color):
+        """Add color to class colors if not already there."""
+        try:
+            if color in cls.color_set:
+                return
+        except TypeError:  # unhashable, e.g. list of RGB values
+            if color in cls.colors:
+                return
+        else:
+            cls.color_set.add(color)
+        cls.colors.append(color)
+
+    def _refresh_transforms(self, *args):
+        """(Re)define transforms between data coords and px coords."""
+        self.datatopx = self.ax.transData.transform  # data coords to px coords
+        self.pxtodata = self.ax.transData.inverted().transform  # px to data coords
 
     def get_pt_position(self, pt, option='data'):
         """Gets point position as a tuple from matplotlib line object.
 
         Options : 'data' (axis data coords, default) or 'px' (pixel coords).
         """
-        # if orig=True (default), the format is not always consistent
-        xpt, ypt = pt.get_data(orig=False)
-        # convert numpy array to scalar, faster than unpacking
-        pos = xpt.item(), ypt.item()
+        # (1, 2) array of the line's cached data (no copy), always consistent
+        # contrary to get_data(orig=True)
+        xy, = pt.get_xydata()
         if option == 'data':
-            return pos
+            x, y = xy.tolist()
+            return x, y
         elif option == 'px':
-            pos_px = self.datatopx(pos)
+            pos_px = self.datatopx(xy)
             return pos_px
         else:
             raise ValueError(f'{option} not a valid argument.')
@@ -298,20 +421,39 @@ class InteractiveObject:
     def class_objects(cls):
         """Return all instances of a given class, excluding parent class."""
         # note : isinstance(obj, class) would also return the parent's objects
-        instances = [obj for obj in cls.all_objects() if type(obj) is cls]
+        instances = [obj for obj in cls.all_interactive_objects.values()
+                     if type(obj) is cls]
         return instances
 
     @classmethod
     def all_objects(cls):
         """Return all interactive objects, including parents and subclasses."""
-        return cls.all_interactive_objects
+        return list(cls.all_interactive_objects.values())
 
     @classmethod
     def clear(cls):
         """Delete all interactive objects of the class and its subclasses."""
-        objects = [obj for obj in cls.all_objects()]  # needed to avoid iterating over decreasing set
-        for obj in objects:
-            obj.delete()
+        objects = cls.all_objects()  # copy, because objects are removed
+        with cls.batch_updates(*{obj.fig for obj in objects}):
+            for obj in objects:
+                obj.delete()
+
+    @classmethod
+    @contextlib.contextmanager
+    def batch_updates(cls, *figs):
+        """Context manager redrawing figs only once, when exiting the block.
+
+        Objects erased or deleted within the block do not trigger a redraw
+        of their figure each; nested blocks on the same figure are allowed.
+        """
+        figs = [fig for fig in figs if fig not in cls.deferred_draws]
+        cls.deferred_draws.update(figs)
+        try:
+            yield
+        finally:
+            for fig in figs:
+                cls.deferred_draws.discard(fig)
+                fig.canvas.draw_idle()
 
 # TO DEFINE IN SUBCLASSES ====================================================
 
@@ -335,51 +477,53 @@ class InteractiveObject:
 
     def connect(self):
         """connect object to figure canvas events"""
+        # all objects of a canvas share a single matplotlib callback per event
+        connect = self.event_dispatcher.connect
         # mouse events
-        self.cidpress = self.fig.canvas.mpl_connect('button_press_event',
-                                                    self.on_mouse_press)
-        self.cidrelease = self.fig.canvas.mpl_connect('button_release_event',
-                                                      self.on_mouse_release)
-        self.cidpick = self.fig.canvas.mpl_connect('pick_event',
-                                                   self.on_pick)
-        self.cidmotion = self.fig.canvas.mpl_connect('motion_notify_event',
-                                                     self.on_motion)
+        self.cidpress = connect('button_press_event', self.on_mouse_press)
+        self.cidrelease = connect('button_release_event', self.on_mouse_release)
+        self.cidpick = connect('pick_event', self.on_pick)
+        self.cidmotion = connect('motion_notify_event', self.on_motion)
         # key events
-        self.cidpressk = self.fig.canvas.mpl_connect('key_press_event',
-                                                     self.on_key_press)
-        self.cidreleasek = self.fig.canvas.mpl_connect('key_release_event',
-                                                       self.on_key_release)
+        self.cidpressk = connect('key_press_event', self.on_key_press)
+        self.cidreleasek = connect('key_release_event', self.on_key_release)
         # figure events
-        self.cidfigenter = self.fig.canvas.mpl_connect('figure_enter_event',
-                                                       self.on_enter_figure)
-        self.cidfigleave = self.fig.canvas.mpl_connect('figure_leave_event',
-                                                       self.on_leave_figure)
-        self.cidaxenter = self.fig.canvas.mpl_connect('axes_enter_event',
-                                                      self.on_enter_axes)
-        self.cidaxleave = self.fig.canvas.mpl_connect('axes_leave_event',
-                                                      self.on_leave_axes)
-        self.cidclose = self.fig.canvas.mpl_connect('close_event',
-                                                    self.on_close)
-        self.cidresize = self.fig.canvas.mpl_connect('resize_event',
-                                                     self.on_resize)
+        self.cidfigenter = connect('figure_enter_event', self.on_enter_figure)
+        self.cidfigleave = connect('figure_leave_event', self.on_leave_figure)
+        self.cidaxenter = connect('axes_enter_event', self.on_enter_axes)
+        self.cidaxleave = connect('axes_leave_event', self.on_leave_axes)
+        self.cidclose = connect('close_event', self.on_close)
+        self.cidresize = connect('resize_event', self.on_resize)
+        self.ciddraw = connect('draw_event', self.on_draw)
+        # axes events (zoom, pan etc.) invalidate the data <--> px transforms
+        self.transforms_ax = self.ax
+        self.cidtransx = self.ax.callbacks.connect('xlim_changed',
+                                                   self._refresh_transforms)
+        self.cidtransy = self.ax.callbacks.connect('ylim_changed',
+                                                   self._refresh_transforms)
 
     def disconnect(self):
         """disconnect callback ids"""
+        disconnect = self.event_dispatcher.disconnect
         # mouse events
-        self.fig.canvas.mpl_disconnect(self.cidpress)
-        self.fig.canvas.mpl_disconnect(self.cidrelease)
-        self.fig.canvas.mpl_disconnect(self.cidmotion)
-        self.fig.canvas.mpl_disconnect(self.cidpick)
+        disconnect(self.cidpress)
+        disconnect(self.cidrelease)
+        disconnect(self.cidmotion)
+        disconnect(self.cidpick)
         # key events
-        self.fig.canvas.mpl_disconnect(self.cidpressk)
-        self.fig.canvas.mpl_disconnect(self.cidreleasek)
+        disconnect(self.cidpressk)
+        disconnect(self.cidreleasek)
         # figure events
-        self.fig.canvas.mpl_disconnect(self.cidfigenter)
-        self.fig.canvas.mpl_disconnect(self.cidfigleave)
-        self.fig.canvas.mpl_disconnect(self.cidaxenter)
-        self.fig.canvas.mpl_disconnect(self.cidaxleave)
-        self.fig.canvas.mpl_disconnect(self.cidclose)
-        self.fig.canvas.mpl_disconnect(self.cidresize)
+        disconnect(self.cidfigenter)
+        disconnect(self.cidfigleave)
+        disconnect(self.cidaxenter)
+        disconnect(self.cidaxleave)
+        disconnect(self.cidclose)
+        disconnect(self.cidresize)
+        disconnect(self.ciddraw)
+        # axes events
+        self.transforms_ax.callbacks.disconnect(self.cidtransx)
+        self.transforms_ax.callbacks.disconnect(self.cidtransy)
 
 # ============================= callback methods =============================
 
@@ -407,6 +551,14 @@ class InteractiveObject:
             return
         # only the leader triggers moving events (others drawn in update_graph)
         if self.__class__.leader is self:
+            # no update when mouse is outside of the axes of moving objects
+            # (bbox used rather than event.inaxes, which can be a twin axes)
+            if not self.ax.bbox.contains(event.x, event.y):
+                return
+            xy_px = int(event.x), int(event.y)
+            if xy_px == self._last_xy_px:
+                return  # e.g. mouse jitter within the same pixel
+            self._last_xy_px = xy_px
             self.update_graph(event)
 
     def on_mouse_release(self, event):
@@ -441,13 +593,15 @@ class InteractiveObject:
 
     def on_resize(self, event):
         """When resizing, re-adjust the conversion from pixels to data pts."""
-        # Transforms functions to go from px to data coords.
-        # Need to be redefined if figure is resized or if zooming occurs
-        self.datatopx = self.ax.transData.transform  # transform between data coords to px coords.
-        self.pxtodata = self.ax.transData.inverted().transform  # pixels to data coordinates
+        self._refresh_transforms()
+
+    def on_draw(self, event):
+        """Figure has been redrawn: queued redraw (if any) has been done."""
+        self.__class__.render_pending.discard(self.fig)
 
     def on_close(self, event):
         """Delete object if figure is closed"""
+        self.__class__.render_pending.discard(self.fig)
         self.delete()
 
 
@@ -41,16 +41,19 @@ class Line(InteractiveObject):
     - `blit` (bool, default True). If True, blitting is used for fast rendering
     - `block`(bool, default False). If True, object blocks the console
     (block not implemented yet for Line and Rect)
+    - `raise_window` (bool, default True). Bring figure window to the front
+    (only once per figure if not blocking, see bring_to_front()).
     """
 
     name = 'Draggable Line'
 
     def __init__(self, fig=None, ax=None, pickersize=5, color=None, c=None,
                  ptstyle='.', ptsize=8, linestyle='-', linewidth=1,
-                 avoid_existing=True, blit=True, block=False):
+                 avoid_existing=True, blit=True, block=False,
+                 raise_window=True):
 
         super().__init__(fig=fig, ax=ax, color=color, c=c,
-                         blit=blit, block=block)
+                         blit=blit, block=block, raise_window=raise_window)
 
         xlim, ylim = self.ax.get_xlim(), self.ax.get_ylim()
 
@@ -181,30 +184,30 @@ class Line(InteractiveObject):
         mode = self.active_info['mode']
         active_pts = self.active_info['pts']
 
+        positions = self.moving_positions  # px positions of pt1, pt2 (rows)
+        index = self.pt_index
+
         # EDGE mode: move just one point, the other one stays fixed ----------
         if mode == 'edge':
             pt, = active_pts  # should be the only pt in active_pts
-            self.moving_positions[pt] = x, y
+            positions[index[pt]] = x, y
 
         # WHOLE mode: move the line as a whole in a parallel fashion ---------
         else:
             # get where click was initially made and calculate motion
             x0, y0 = self.press_info['click']
-            dx, dy = x - x0, y - y0
+            rows = [index[pt] for pt in active_pts]
+            positions[rows] = self.press_positions[rows] + (x - x0, y - y0)
 
-            for pt in active_pts:
-                x0_pt, y0_pt = self.press_info[pt]
-                self.moving_positions[pt] = x0_pt + dx, y0_pt + dy
+        # now apply the changes to the graph (single px --> data transform)
+        data = self.pxtodata(positions)
 
-        # now apply the changes to the graph
         for pt in active_pts:
-            xnew, ynew = self.pxtodata(self.moving_positions[pt])
+            xnew, ynew = data[index[pt]]
             pt.set_data(xnew, ynew)
 
-        pt1, pt2, link = self.all_artists
-        x1, y1 = self.pxtodata(self.moving_positions[pt1])
-        x2, y2 = self.pxtodata(self.moving_positions[pt2])
-        link.set_data([x1, x2], [y1, y2])
+        _, _, link = self.all_artists
+        link.set_data(data[:, 0], data[:, 1])
 
 # ============================= callback methods =============================
 
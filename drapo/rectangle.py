@@ -40,16 +40,18 @@ class Rect(InteractiveObject):
     - `block`(bool, default False). If True, object blocks the console
     (block not implemented yet for Line and Rect).
     - `timeout` (float, default 0, i.e. infinite) timeout for blocking.
+    - `raise_window` (bool, default True). Bring figure window to the front
+    (only once per figure if not blocking, see bring_to_front()).
     """
 
     name = "Draggable Rectangle"
 
     def __init__(self, fig=None, ax=None, position=None, pickersize=5, c=None,
                  color=None, ptstyle='.', ptsize=8, linestyle='-', linewidth=1,
-                 blit=True, block=False, timeout=0):
+                 blit=True, block=False, timeout=0, raise_window=True):
 
         super().__init__(fig=fig, ax=ax, color=color, c=c,
-                         blit=blit, block=block)
+                         blit=blit, block=block, raise_window=raise_window)
 
         xlim, ylim = self.ax.get_xlim(), self.ax.get_ylim()
 
@@ -302,6 +304,9 @@ class Rect(InteractiveObject):
         active_lines = self.active_info['lines']
         mode = self.active_info['mode']
 
+        positions = self.moving_positions  # px positions of pts (rows)
+        index = self.pt_index
+
         if mode in ['horz_edge', 'vert_edge', 'center']:
 
             # get where click was initially made and calculate motion
@@ -310,48 +315,45 @@ class Rect(InteractiveObject):
             dy = y - y0 if mode != 'vert_edge' else 0
 
             for pt in active_pts:
-                x0_pt, y0_pt = self.press_info[pt]
+                i = index[pt]
+                x0_pt, y0_pt = self.press_positions[i]
                 if pt != self.center:
-                    x_new, y_new = x0_pt + dx, y0_pt + dy
+                    positions[i] = x0_pt + dx, y0_pt + dy
                 else:   # center point
                     norm = 1 if mode == 'center' else 0.5
-                    x_new = x0_pt + dx * norm
-                    y_new = y0_pt + dy * norm
-                self.moving_positions[pt] = x_new, y_new
+                    positions[i] = x0_pt + dx * norm, y0_pt + dy * norm
 
         elif mode in range(4):  # corner motion
 
             i = mode
-            picked_corner = self.corners[i]
-            next_corner = self.corners[(i + 1) % 4]
-            prev_corner = self.corners[(i - 1) % 4]
-            opposite_corner = self.corners[(i + 2) % 4]
+            picked = index[self.corners[i]]
+            following = index[self.corners[(i + 1) % 4]]
+            previous = index[self.corners[(i - 1) % 4]]
+            opposite = index[self.corners[(i + 2) % 4]]
 
-            self.moving_positions[picked_corner] = x, y
-            xprev, yprev = self.moving_positions[prev_corner]
-            xnext, ynext = self.moving_positions[next_corner]
+            positions[picked] = x, y
 
             if i % 2:  # bottom right corner or top left
-                self.moving_positions[prev_corner] = xprev, y
-                self.moving_positions[next_corner] = x, ynext
+                positions[previous, 1] = y
+                positions[following, 0] = x
             else:  # bottom left or top right corner
-                self.moving_positions[prev_corner] = x, yprev
-                self.moving_positions[next_corner] = xnext, y
+                positions[previous, 0] = x
+                positions[following, 1] = y
 
             # Calculate center pos from picked pt and diagonally opposed one
-            x1, y1 = self.moving_positions[picked_corner]
-            x2, y2 = self.moving_positions[opposite_corner]
-            self.moving_positions[self.center] = (x1 + x2) / 2, (y1 + y2) / 2
+            positions[index[self.center]] = (positions[picked] + positions[opposite]) / 2
+
+        # now apply the changes to the graph (single px --> data transform) --
+        data = self.pxtodata(positions)
 
-        # now apply the changes to the graph ---------------------------------
         for pt in active_pts:
-            xnew, ynew = self.pxtodata(self.moving_positions[pt])
+            xnew, ynew = data[index[pt]]
             pt.set_data(xnew, ynew)
 
         for line in active_lines:
             i = self.edges.index(line)
-            x1, y1 = self.pxtodata(self.moving_positions[self.corners[i - 1]])
-            x2, y2 = self.pxtodata(self.moving_positions[self.corners[i]])
+            x1, y1 = data[index[self.corners[i - 1]]]
+            x2, y2 = data[index[self.corners[i]]]
             line.set_data([x1, x2], [y1, y2])
 
 # ============================ callback functions ============================
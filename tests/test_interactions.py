@@ -0,0 +1,374 @@
+"""Headless tests of interactions with drapo objects (Agg canvas)."""
+
+
+import gc
+import io
+import weakref
+
+import numpy as np
+import pytest
+import matplotlib.pyplot as plt
+from matplotlib.backend_bases import CloseEvent, KeyEvent, MouseEvent, TimerBase
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import to_hex
+from matplotlib.figure import Figure
+
+from drapo import Cursor, Line, Rect, ginput
+from drapo.blit_manager import get_blit_manager
+from drapo.event_dispatcher import get_event_dispatcher
+from drapo.interactive_object import InteractiveObject
+
+
+# ================================ test tools ================================
+
+
+class QueuedTimer(TimerBase):
+    """Timer whose events are queued in the event loop of a QueuedCanvas."""
+
+    def __init__(self, queue, *args, **kwargs):
+        self.queue = queue
+        super().__init__(*args, **kwargs)
+
+    def _timer_start(self):
+        self.queue.append(self._on_timer)
+
+
+class QueuedCanvas(FigureCanvasAgg):
+    """Agg canvas with a fake event loop, to mimic GUI backends (e.g. Qt).
+
+    draw_idle() and timers are queued and only processed by run_queue(),
+    and draw_idle() is ignored while the canvas is drawing.
+    """
+
+    def __init__(self, figure=None):
+        super().__init__(figure)
+        self.queue = []
+        self.is_drawing = False
+        self.draw_pending = False
+
+    def draw(self):
+        if self.is_drawing:
+            return
+        self.is_drawing = True
+        try:
+            super().draw()
+        finally:
+            self.is_drawing = False
+
+    def draw_idle(self, *args, **kwargs):
+        if not (self.draw_pending or self.is_drawing):
+            self.draw_pending = True
+            self.queue.append(self.idle_draw)
+
+    def idle_draw(self):
+        self.draw_pending = False
+        self.draw()
+
+    def new_timer(self, *args, **kwargs):
+        return QueuedTimer(self.queue, *args, **kwargs)
+
+    def run_queue(self):
+        """Process queued events until there is nothing left to do."""
+        while self.queue:
+            self.queue.pop(0)()
+
+    def start_event_loop(self, timeout=0):
+        """Process queued events until stop_event_loop() or empty queue."""
+        self.looping = True
+        while self.looping and self.queue:
+            self.queue.pop(0)()
+
+    def stop_event_loop(self):
+        self.looping = False
+
+
+def new_figure(canvas_class=FigureCanvasAgg):
+    """Figure with a single axes, drawn once, not managed by pyplot."""
+    fig = Figure()
+    canvas_class(fig)
+    ax = fig.add_subplot()
+    ax.plot([0, 1], [0, 1])
+    fig.canvas.draw()
+    return fig, ax
+
+
+def mouse(ax, name, x, y, button=None, px=False):
+    """Send mouse event at data position (x, y), or pixel position if px."""
+    if not px:
+        x, y = ax.transData.transform((x, y))
+    event = MouseEvent(name, ax.figure.canvas, round(x), round(y), button)
+    event._process()
+    return event
+
+
+def drag(ax, xy_px, shift_px):
+    """Press left button at pixel position xy_px, move and release."""
+    (x, y), (dx, dy) = np.round(xy_px), shift_px
+    mouse(ax, 'button_press_event', x, y, 1, px=True)
+    mouse(ax, 'motion_notify_event', x + dx / 2, y + dy / 2, 1, px=True)
+    mouse(ax, 'motion_notify_event', x + dx, y + dy, 1, px=True)
+    mouse(ax, 'button_release_event', x + dx, y + dy, 1, px=True)
+
+
+def click(ax, x, y, button=1):
+    """Move to data position (x, y) and click there; return release event."""
+    mouse(ax, 'motion_notify_event', x, y)
+    mouse(ax, 'button_press_event', x, y, button)
+    return mouse(ax, 'button_release_event', x, y, button)
+
+
+# ================================== tests ===================================
+
+
+def test_event_dispatcher_connect_disconnect():
+    """Dispatcher calls all connected methods with a single canvas callback."""
+    fig, _ = new_figure()
+    canvas = fig.canvas
+    dispatcher = get_event_dispatcher(canvas)
+    assert get_event_dispatcher(canvas) is dispatcher
+
+    def ncanvas_callbacks():
+        return len(canvas.callbacks.callbacks.get('key_press_event', {}))
+
+    n0 = ncanvas_callbacks()
+    calls = []
+    cid1 = dispatcher.connect('key_press_event', lambda event: calls.append(1))
+    cid2 = dispatcher.connect('key_press_event', lambda event: calls.append(2))
+    assert ncanvas_callbacks() == n0 + 1
+
+    KeyEvent('key_press_event', canvas, 'a')._process()
+    assert calls == [1, 2]
+
+    dispatcher.disconnect(cid1)
+    dispatcher.disconnect(cid1)  # already disconnected: nothing happens
+    KeyEvent('key_press_event', canvas, 'a')._process()
+    assert calls == [1, 2, 2]
+
+    dispatcher.disconnect(cid2)
+    assert ncanvas_callbacks() == n0
+    KeyEvent('key_press_event', canvas, 'a')._process()
+    assert calls == [1, 2, 2]
+
+
+def test_cursor_coalescing_without_blit():
+    """Non-blitting cursor keeps following the mouse with deferred redraws."""
+    fig, ax = new_figure(QueuedCanvas)
+    canvas = fig.canvas
+    c = Cursor(fig=fig, blit=False)
+
+    mouse(ax, 'motion_notify_event', 0.5, 0.5)  # creates cursor
+    canvas.run_queue()
+
+    mouse(ax, 'motion_notify_event', 0.6, 0.5)
+    event = mouse(ax, 'motion_notify_event', 0.7, 0.5)  # redraw in flight
+    canvas.run_queue()
+    _, vline = c.all_artists
+    assert vline.get_xdata()[0] == event.xdata
+
+    for x in 0.8, 0.9:
+        event = mouse(ax, 'motion_notify_event', x, 0.5)
+    canvas.run_queue()
+    assert vline.get_xdata()[0] == event.xdata
+    assert not c._draw_scheduled
+
+    # mouse back on the last drawn pixel while a position is pending
+    mouse(ax, 'motion_notify_event', 0.7, 0.5)
+    mouse(ax, 'motion_notify_event', 0.8, 0.5)
+    event = mouse(ax, 'motion_notify_event', 0.7, 0.5)
+    canvas.run_queue()
+    assert vline.get_xdata()[0] == event.xdata
+
+    c.delete()
+
+
+def move_axes(fig, layout):
+    """Move axes without changing axes limits nor figure size."""
+    if layout == 'tight':
+        fig.tight_layout()
+    elif layout == 'constrained':
+        fig.set_layout_engine('constrained')
+    else:
+        fig.colorbar(fig.axes[0].scatter([0.5], [0.5], c=[1]))
+    fig.canvas.draw()
+
+
+@pytest.mark.parametrize('layout', ['tight', 'constrained', 'colorbar'])
+def test_line_drag_after_layout_change(layout):
+    """Dragged line point stays under the mouse after axes have moved."""
+    fig, ax = new_figure()
+    line = Line(fig=fig, ax=ax)
+    fig.canvas.draw()
+    move_axes(fig, layout)
+
+    pt1, pt2 = line.all_pts
+    xy1_px = np.round(line.get_pt_position(pt1, 'px'))  # pt snaps to mouse
+    xy2 = line.get_pt_position(pt2)
+    drag(ax, xy1_px, (12, -7))
+
+    expected = ax.transData.inverted().transform(xy1_px + (12, -7))
+    assert np.allclose(line.get_pt_position(pt1), expected)
+    assert np.allclose(line.get_pt_position(pt2), xy2)
+
+
+@pytest.mark.parametrize('layout', ['tight', 'constrained', 'colorbar'])
+def test_rect_drag_after_layout_change(layout):
+    """Rectangle moved by its center follows the mouse after axes moved."""
+    fig, ax = new_figure()
+    rect = Rect(fig=fig, ax=ax)
+    fig.canvas.draw()
+    move_axes(fig, layout)
+
+    corners_px = np.array([rect.get_pt_position(pt, 'px')
+                           for pt in rect.corners])
+    center_px = rect.get_pt_position(rect.center, 'px')
+    drag(ax, center_px, (-9, 15))
+
+    corners = [rect.get_pt_position(pt) for pt in rect.corners]
+    expected = ax.transData.inverted().transform(corners_px + (-9, 15))
+    assert np.allclose(corners, expected)
+
+
+def test_cursor_click_marks_blitted():
+    """Plain clicks of a blitting cursor are marked without full redraws."""
+    fig, ax = new_figure()
+    c = Cursor(fig=fig, show_clicks=True, record_clicks=True)
+    mouse(ax, 'motion_notify_event', 0.4, 0.4)
+
+    draws = []
+    cid = fig.canvas.mpl_connect('draw_event', draws.append)
+    # (clicks away from the plotted line, which is above marks in full draws)
+    for xy in (0.3, 0.6), (0.5, 0.2), (0.6, 0.8), (0.2, 0.4), (0.8, 0.4):
+        mouse(ax, 'motion_notify_event', *xy)
+        mouse(ax, 'button_press_event', *xy, 1)
+        mouse(ax, 'button_release_event', *xy, 1)
+    fig.canvas.mpl_disconnect(cid)
+
+    assert c.clicknumber == 5
+    assert len(draws) == 0
+
+    # marks blitted on the background are the same as with a full draw
+    background = np.asarray(c.blit_manager.background).copy()
+    fig.canvas.draw()
+    assert np.array_equal(np.asarray(c.blit_manager.background), background)
+    c.delete()
+
+
+def test_objects_live_as_long_as_figure():
+    """Objects without user reference work, and are collected with figure."""
+    fig, ax = new_figure()
+    Line(fig=fig, ax=ax)
+    Rect(fig=fig, ax=ax)
+    gc.collect()
+
+    objects = [obj for obj in InteractiveObject.all_objects() if obj.fig is fig]
+    assert [type(obj) for obj in objects] == [Line, Rect]
+    refs = [weakref.ref(obj) for obj in (fig, *objects)]
+    del objects
+
+    CloseEvent('close_event', fig.canvas)._process()
+    del fig, ax
+    gc.collect()
+    assert all(ref() is None for ref in refs)
+
+
+def test_blit_manager_reuses_background():
+    """Background is saved with a full draw only if axes contents changed."""
+    fig, ax = new_figure()
+    line = Line(fig=fig, ax=ax)
+    fig.canvas.draw()
+    assert line.blit_manager is get_blit_manager(fig.canvas)
+
+    draws = []
+    fig.canvas.mpl_connect('draw_event', draws.append)
+    link_px = np.mean([line.get_pt_position(pt, 'px') for pt in line.all_pts],
+                      axis=0)
+    drag(ax, link_px, (10, 10))
+    assert len(draws) == 1  # background without the animated line
+    drag(ax, link_px + (10, 10), (-5, 8))
+    assert len(draws) == 1  # same background as before
+
+    ax.plot([0, 1], [1, 0])
+    drag(ax, link_px + (5, 18), (3, 3))
+    assert len(draws) == 2
+
+
+def test_ginput_values(monkeypatch):
+    """ginput returns clicked data positions; removed clicks are dropped."""
+    fig, ax = new_figure(QueuedCanvas)
+    monkeypatch.setattr(plt, 'gcf', lambda: fig)
+
+    releases = []
+    clicks = (0.2, 0.3, 1), (0.5, 0.5, 3), (0.6, 0.1, 1), (0.9, 0.8, 1), (0.4, 0.7, 1)
+    for x, y, button in clicks:
+        fig.canvas.queue.append(lambda x=x, y=y, button=button:
+                                releases.append(click(ax, x, y, button)))
+
+    data = ginput(3)
+    expected = [(event.xdata, event.ydata) for event in releases[2:]]
+    assert data == expected
+    assert Cursor.active_cursor(fig) is None
+
+
+def test_ginput_reuses_active_cursor(monkeypatch):
+    """ginput on a figure with a cursor uses it, and restores its settings."""
+    fig, ax = new_figure(QueuedCanvas)
+    monkeypatch.setattr(plt, 'gcf', lambda: fig)
+    c = Cursor(fig=fig, show_clicks=True, record_clicks=True)
+    c.add_point((0.5, 0.5))
+
+    releases = []
+    for x, y in (0.2, 0.3), (0.6, 0.1):
+        fig.canvas.queue.append(lambda x=x, y=y:
+                                releases.append(click(ax, x, y)))
+
+    data = ginput(2, show_clicks=False)
+    assert data == [(event.xdata, event.ydata) for event in releases]
+    assert Cursor.active_cursor(fig) is c
+    assert c.clickdata.tolist() == [[0.5, 0.5]]
+    assert c.n == 1000 and c.markclicks and not c.block
+
+    # right click at the beginning of ginput: mark of the cursor is kept
+    releases = []
+    for x, y, button in (0.3, 0.3, 3), (0.2, 0.3, 1), (0.6, 0.1, 1):
+        fig.canvas.queue.append(lambda x=x, y=y, button=button:
+                                releases.append(click(ax, x, y, button)))
+
+    data = ginput(2)
+    assert data == [(event.xdata, event.ydata) for event in releases[1:]]
+    assert c.marks[ax].get_offsets().tolist() == [[0.5, 0.5]]
+    assert c.clickdata.tolist() == [[0.5, 0.5]]
+    assert c.kept_marks == 0
+    c.delete()
+
+
+def test_blit_manager_ignores_savefig():
+    """Saving figure (vector format or other dpi) keeps screen background."""
+    fig, ax = new_figure()
+    line = Line(fig=fig, ax=ax)
+    c = Cursor(fig=fig)
+    mouse(ax, 'motion_notify_event', 0.3, 0.6)  # cursor enters axes
+    pt1, _ = line.all_pts
+    drag(ax, line.get_pt_position(pt1, 'px'), (5, 5))
+
+    manager = line.blit_manager
+    mouse(ax, 'motion_notify_event', 0.4, 0.7)
+    background, stale = manager.background, manager.stale
+    for fmt, dpi in ('pdf', None), ('svg', None), ('png', 2 * fig.dpi):
+        fig.savefig(io.BytesIO(), format=fmt, dpi=dpi)
+    assert manager.background is background
+    assert manager.stale == stale
+    assert manager.background_key[0] == ax.bbox.bounds
+    c.delete()
+
+
+def test_cursor_marks_keep_color_cycle():
+    """Click marks do not use colors of the axes color cycle."""
+    fig, ax = new_figure()
+    c = Cursor(fig=fig, show_clicks=True)
+    click(ax, 0.4, 0.6)
+    assert len(c.marks[ax].get_offsets()) == 1
+
+    collection = ax.scatter([0.5], [0.5])
+    assert to_hex(collection.get_facecolor()[0]) == to_hex('C0')
+    c.delete()
+